@@ -1,6 +1,7 @@
 import json
+import sys
 from functools import lru_cache
-from typing import Optional, Any
+from typing import Optional, Any, Tuple
 from pathlib import Path
 from sovl_schema import (
        GestationConfig,
@@ -40,6 +41,11 @@ from sovl_schema import (
        GrafterConfig
    )
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 """
 SOVL Config Manager
 
@@ -88,19 +94,35 @@ class SOVLConfig:
     grafter: Optional[GrafterConfig] = None
 
 _config_instance: Optional[SOVLConfig] = None
+_MISSING = object()
+
+@lru_cache(maxsize=None)
+def _key_parts(key: str) -> Tuple[str, ...]:
+    """
+    Split a dot-separated config key once; repeated lookups reuse the tuple.
+    Parts are interned so attribute and dict lookups hit the identity fast path.
+    """
+    return tuple(sys.intern(part) for part in key.split("."))
 
 def load_config(path: str = CONFIG_PATH, reload: bool = False) -> SOVLConfig:
     """
     Load and validate the SOVL config from JSON.
-    Caches the config instance unless reload=True.
+    Caches the config instance unless reload=True. A reload builds the new
+    instance off to the side and publishes it with a single assignment, so
+    concurrent readers see either the old or the new config, never None.
     """
     global _config_instance
     if _config_instance is not None and not reload:
         return _config_instance
-    with open(path, "r") as f:
-        data = json.load(f)
-    _config_instance = SOVLConfig(**data)
-    return _config_instance
+    if orjson is not None:
+        with open(path, "rb") as f:
+            data = orjson.loads(f.read())
+    else:
+        with open(path, "r") as f:
+            data = json.load(f)
+    config = SOVLConfig(**data)
+    _config_instance = config
+    return config
 
 def get_config() -> SOVLConfig:
     """
@@ -112,14 +134,15 @@ def get(key: str, default: Any = None) -> Any:
     """
     Legacy helper: get a config value by dot-separated key, e.g. 'controls_config.base_temperature'.
     """
-    config = load_config()
-    parts = key.split(".")
-    value = config
-    for part in parts:
-        if hasattr(value, part):
-            value = getattr(value, part)
-        elif isinstance(value, dict) and part in value:
-            value = value[part]
+    value = load_config()
+    for part in _key_parts(key):
+        attr = getattr(value, part, _MISSING)
+        if attr is not _MISSING:
+            value = attr
+        elif isinstance(value, dict):
+            value = value.get(part, _MISSING)
+            if value is _MISSING:
+                return default
         else:
             return default
     return value
@@ -168,9 +191,7 @@ class ConfigManager:
             return ConfigNamespace(section)
         raise AttributeError(f"ConfigManager has no attribute '{name}'")
     def reload(self):
-        global _config_instance
-        _config_instance = None
-        self._config = load_config()
+        self._config = load_config(reload=True)
         return self._config
 
 # Example usage for CLI or scripts
@@ -1,10 +1,16 @@
 import time
-from typing import Any, Dict, List, Optional, Deque, Tuple
-from collections import deque, defaultdict, Counter
+from typing import Any, Dict, List, NamedTuple, Optional, Deque, Tuple
+from collections import deque, defaultdict, OrderedDict
+import sys
+import logging
+import asyncio
+import atexit
+import queue
 import traceback
 import threading
+import heapq
 import torch
-from torch import nn
+import torch.nn.functional as F
 from datetime import datetime
 from sovl_error import ErrorManager
 from sovl_state import StateManager
@@ -22,6 +28,123 @@ def output_response(text: str):
     """Outputs a response to the user. Replace with UI logic as needed."""
     print(text)
 
+# Logger and scribe calls from the curiosity request path run on one daemon writer thread
+class _EmitRecord(NamedTuple):
+    """One queued emission: a logger call (kind "event" or "error"), a scribe event, or both."""
+    kind: str  # _EMIT_EVENT (logger.record_event), _EMIT_ERROR (logger.log_error) or _EMIT_SCRIBE
+    logger: Any
+    payload: Optional[Dict[str, Any]]  # Logger call keyword arguments
+    scribe: Optional[Dict[str, Any]]  # capture_scribe_event keyword arguments
+    enqueue_ts: float  # time.time() at enqueue; stamps both halves
+
+_EMIT_EVENT = "event"
+_EMIT_ERROR = "error"
+_EMIT_SCRIBE = "scribe"
+_EMIT_QUEUE_MAXSIZE = 20_000
+_emit_queue: "queue.Queue[_EmitRecord]" = queue.Queue(maxsize=_EMIT_QUEUE_MAXSIZE)
+_emit_thread: Optional[threading.Thread] = None
+_emit_thread_lock = threading.Lock()
+_EMIT_BATCH_MAX = 256  # Most emissions handled per writer wakeup
+_EMIT_BATCH_WINDOW = 0.01  # Seconds a wakeup keeps collecting an ongoing burst
+_emit_fallback_logger = logging.getLogger(__name__)  # Sink failures can't go back through the failing sink
+
+def _run_emit(fn, args: tuple, kwargs: dict) -> None:
+    """Invoke a queued emission; a failing sink must never take down the writer."""
+    try:
+        fn(*args, **kwargs)
+    except Exception as e:
+        _emit_fallback_logger.error(f"Curiosity event emission failed: {str(e)}", exc_info=True)
+
+def _capture_scribe_event_at(unix_time: float, **kwargs) -> None:
+    """capture_scribe_event stamped from a time.time() value; the datetime is built on the writer thread."""
+    capture_scribe_event(timestamp=datetime.fromtimestamp(unix_time), **kwargs)
+
+def _is_batchable(record: _EmitRecord) -> bool:
+    """Only record_event calls on a sovl Logger can be folded into one record_events write."""
+    return record.kind == _EMIT_EVENT and isinstance(record.logger, Logger)
+
+def _run_record(record: _EmitRecord) -> None:
+    """Emit one record on its own: the logger half first, then the scribe half."""
+    if record.kind == _EMIT_EVENT:
+        _run_emit(record.logger.record_event, (), record.payload)
+    elif record.kind == _EMIT_ERROR:
+        _run_emit(record.logger.log_error, (), record.payload)
+    if record.scribe is not None:
+        _run_emit(_capture_scribe_event_at, (record.enqueue_ts,), record.scribe)
+
+def _flush_event_run(run: List[_EmitRecord]) -> None:
+    """Emit a run of batchable records for one logger: one record_events call, then the scribe halves in order."""
+    events = [dict(record.payload, timestamp=record.enqueue_ts) for record in run]
+    _run_emit(run[0].logger.record_events, (events,), {})
+    for record in run:
+        if record.scribe is not None:
+            _run_emit(_capture_scribe_event_at, (record.enqueue_ts,), record.scribe)
+
+def _dispatch_emit_batch(batch: List[_EmitRecord]) -> None:
+    """
+    Emit a drained batch in queue order. Consecutive batchable events for the same logger are
+    written as one run; the pending run is flushed before any other record, so each sink sees
+    records in the order they were queued.
+    """
+    run: List[_EmitRecord] = []
+    for record in batch:
+        batchable = _is_batchable(record)
+        if run and not (batchable and record.logger is run[0].logger):
+            _flush_event_run(run)
+            run = []
+        if batchable:
+            run.append(record)
+        else:
+            _run_record(record)
+    if run:
+        _flush_event_run(run)
+
+def _emit_worker() -> None:
+    """Drain the emission queue in bursts: block for the first item, then collect for up to the batch window."""
+    while True:
+        batch = [_emit_queue.get()]
+        deadline = time.monotonic() + _EMIT_BATCH_WINDOW
+        while len(batch) < _EMIT_BATCH_MAX:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(_emit_queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+        _dispatch_emit_batch(batch)
+
+def _emit_async(
+    kind: str,
+    logger: Any = None,
+    payload: Optional[Dict[str, Any]] = None,
+    scribe: Optional[Dict[str, Any]] = None,
+    unix_time: Optional[float] = None
+) -> None:
+    """Queue one record for the writer thread, stamped now unless unix_time is given; emits inline if the queue is full."""
+    global _emit_thread
+    if _emit_thread is None:
+        with _emit_thread_lock:
+            if _emit_thread is None:
+                _emit_thread = threading.Thread(target=_emit_worker, name="curiosity-emit", daemon=True)
+                _emit_thread.start()
+    record = _EmitRecord(kind, logger, payload, scribe, time.time() if unix_time is None else unix_time)
+    try:
+        _emit_queue.put_nowait(record)
+    except queue.Full:
+        _run_record(record)
+
+@atexit.register
+def _flush_emit_queue() -> None:
+    """Emit whatever the daemon writer had not reached before interpreter exit."""
+    batch = []
+    while True:
+        try:
+            batch.append(_emit_queue.get_nowait())
+        except queue.Empty:
+            break
+    _dispatch_emit_batch(batch)
+
 @dataclass
 class CuriosityConfig:
     max_questions: int
@@ -36,13 +159,16 @@ class CuriosityConfig:
 
 class Curiosity:
     """Computes curiosity scores based on ignorance and novelty."""
+
+    _HEALTH_POLL_INTERVAL = 0.25  # Seconds a RAM/GPU health poll stays fresh
+    _MEMORY_LOG_EVERY = 100  # Log every Nth memory usage update unless health changes
     
     def __init__(
         self,
         config_manager: ConfigManager,
         logger: Optional[Any] = None,
         max_memory_mb: float = 512.0,
-        batch_size: int = 32,
+        batch_size: int = 32,  # Deprecated and ignored: novelty is scored in one stacked pass
         ram_manager: Optional[RAMManager] = None,
         gpu_manager: Optional[GPUMemoryManager] = None
     ):
@@ -56,28 +182,32 @@ class Curiosity:
         self.embedding_cache_backup_enabled = config_manager.get("curiosity_config.embedding_cache_backup_enabled", False)
         self.embedding_cache_backup_path = config_manager.get("curiosity_config.embedding_cache_backup_path", "embedding_cache_backup.jsonl")
         self.background_pruning_enabled = config_manager.get("curiosity_config.background_pruning_enabled", True)
-        self.similarity_early_exit_threshold = config_manager.get("curiosity_config.similarity_early_exit_threshold", 0.99)
-        self.adaptive_batch_min = config_manager.get("curiosity_config.adaptive_batch_min", 8)
-        self.adaptive_batch_max = config_manager.get("curiosity_config.adaptive_batch_max", 128)
         
         self._validate_weights(self.weight_ignorance, self.weight_novelty)
         self.logger = logger
         self.max_memory_mb = max_memory_mb
-        self.batch_size = batch_size
         
         # Integrate memory managers
         self.ram_manager = ram_manager
         self.gpu_manager = gpu_manager
         
         # Initialize components
-        self.cosine_similarity = nn.CosineSimilarity(dim=-1, eps=1e-8)
-        self.metrics = deque(maxlen=self.metrics_maxlen)
         self.embedding_cache = {}
-        self.lock = threading.RLock()
+        # (source key, unit-normalized (N, D) memory matrix) reused across novelty queries;
+        # replaced as one tuple so a reader never pairs a key with another key's matrix
+        self._memory_matrix_cache: Optional[Tuple[Tuple[int, torch.Tensor, torch.Tensor, str], torch.Tensor]] = None
+        self.lock = threading.Lock()  # Guards embedding_cache only; no re-entrant acquisition paths
         self.curiosity_score = 0.0  # For external nudges
+        # Last (ram_stats, gpu_stats) poll, reused for _HEALTH_POLL_INTERVAL seconds
+        self._cached_health: Optional[Tuple[Dict[str, Any], Dict[str, Any]]] = None
+        self._last_health_poll = 0.0
+        self._stats_lock = threading.Lock()  # Guards the health poll cache, independent of the cache lock
+        self._mem_log_counter = 0
+        self._last_memory_ok = True
         # For incremental/background pruning
         self._prune_in_progress = False
-        self._prune_event = threading.Event()
+        # Shares self.lock so the prune predicate is checked against the cache atomically
+        self._prune_cv = threading.Condition(self.lock)
         self._prune_thread = None
         self._prune_shutdown = False
         if self.background_pruning_enabled:
@@ -91,31 +221,46 @@ class Curiosity:
         if abs(ignorance + novelty - 1.0) > 1e-6:
             raise ValueError("Weights must sum to 1.0")
 
+    def _poll_memory_stats(self) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """Return (ram_stats, gpu_stats), re-querying the managers at most every _HEALTH_POLL_INTERVAL seconds."""
+        with self._stats_lock:
+            now = time.monotonic()
+            cached = self._cached_health
+            if cached is None or now - self._last_health_poll > self._HEALTH_POLL_INTERVAL:
+                cached = (self.ram_manager.check_memory_health(), self.gpu_manager.get_gpu_usage())
+                self._cached_health = cached
+                self._last_health_poll = now
+            return cached
+
     def _update_memory_usage(self) -> None:
         """Update memory usage tracking using RAM and GPU managers if available."""
         if self.ram_manager and self.gpu_manager:
             try:
-                with self.lock:
-                    ram_stats = self.ram_manager.check_memory_health()
-                    gpu_stats = self.gpu_manager.get_gpu_usage()
-                    ram_ok = self._validate_usage_percentage(ram_stats.get("usage_percentage", -1), "RAMManager", self.logger)
-                    gpu_ok = self._validate_usage_percentage(gpu_stats.get("usage_percentage", -1), "GPUMemoryManager", self.logger)
-                    if not ram_ok or not gpu_ok:
-                        if self.logger:
-                            self.logger.log_error(
-                                error_msg="Invalid memory manager output; assuming high usage.",
-                                error_type="curiosity_memory_error"
-                            )
+                # Stats are guarded by _stats_lock inside the poll; validation and logging need no lock
+                ram_stats, gpu_stats = self._poll_memory_stats()
+                ram_ok = self._validate_usage_percentage(ram_stats.get("usage_percentage", -1), "RAMManager", self.logger)
+                gpu_ok = self._validate_usage_percentage(gpu_stats.get("usage_percentage", -1), "GPUMemoryManager", self.logger)
+                if not ram_ok or not gpu_ok:
                     if self.logger:
-                        self.logger.record_event(
-                            event_type="memory_usage_updated",
-                            message="Memory usage updated",
-                            level="info",
-                            additional_info={
-                                "ram_stats": ram_stats,
-                                "gpu_stats": gpu_stats
-                            }
+                        self.logger.log_error(
+                            error_msg="Invalid memory manager output; assuming high usage.",
+                            error_type="curiosity_memory_error"
                         )
+                # Sample the routine update event; always log when health flips between ok and bad
+                memory_ok = ram_ok and gpu_ok
+                self._mem_log_counter += 1
+                transitioned = memory_ok != self._last_memory_ok
+                self._last_memory_ok = memory_ok
+                if self.logger and (transitioned or self._mem_log_counter % self._MEMORY_LOG_EVERY == 1):
+                    self.logger.record_event(
+                        event_type="memory_usage_updated",
+                        message="Memory usage updated",
+                        level="info",
+                        additional_info={
+                            "ram_stats": ram_stats,
+                            "gpu_stats": gpu_stats
+                        }
+                    )
             except Exception as e:
                 if self.logger:
                     self.logger.log_error(
@@ -133,8 +278,7 @@ class Curiosity:
         fallback_triggered = False
         if self.ram_manager and self.gpu_manager:
             try:
-                ram_stats = self.ram_manager.check_memory_health()
-                gpu_stats = self.gpu_manager.get_gpu_usage()
+                ram_stats, gpu_stats = self._poll_memory_stats()
                 ram_usage = ram_stats.get("usage_percentage", -1)
                 gpu_usage = gpu_stats.get("usage_percentage", -1)
                 ram_ok = self._validate_usage_percentage(ram_usage, "RAMManager", self.logger)
@@ -161,7 +305,8 @@ class Curiosity:
             usage_high = True
             fallback_triggered = True
         if usage_high and self.background_pruning_enabled:
-            self._prune_event.set()
+            with self._prune_cv:
+                self._prune_cv.notify()
         elif usage_high:
             # Fallback: prune on main thread if background pruning is disabled
             self._prune_cache_main_thread()
@@ -178,25 +323,28 @@ class Curiosity:
 
     def _prune_cache_main_thread(self):
         """Prune cache on the main thread (used if background pruning is disabled)."""
-        # Step 1: Collect items to prune and backup under lock
+        # Step 1: Snapshot the cache under lock; select prune candidates outside it
         with self.lock:
-            sorted_cache = sorted(
-                self.embedding_cache.items(),
-                key=lambda x: x[1].get('last_access', 0)
-            )
-            initial_cache_size = len(self.embedding_cache)
-            prune_batch = self.embedding_cache_prune_batch
-            prune_limit = min(prune_batch, initial_cache_size)
-            pruned_items = sorted_cache[:prune_limit]
-            pruned_count = 0
+            snapshot = list(self.embedding_cache.items())
+        initial_cache_size = len(snapshot)
+        prune_limit = min(self.embedding_cache_prune_batch, initial_cache_size)
+        # Only the oldest prune_limit entries are needed: O(N log K) instead of a full sort
+        pruned_items = heapq.nsmallest(
+            prune_limit,
+            snapshot,
+            key=lambda x: x[1].get('last_access', 0)
+        )
+        pruned_count = 0
         # Step 2: Backup to file outside lock
         if self.embedding_cache_backup_enabled and prune_limit > 0:
             try:
                 backup_path = self.embedding_cache_backup_path
-                with open(backup_path, "a", encoding="utf-8") as f:
-                    for key, value in pruned_items:
-                        json.dump({"key": key, "value": value}, f, default=str)
-                        f.write("\n")
+                payload = "".join(
+                    json.dumps({"key": key, "value": value}, default=str) + "\n"
+                    for key, value in pruned_items
+                )
+                with open(backup_path, "a", encoding="utf-8", buffering=1 << 20) as f:
+                    f.write(payload)
             except Exception as e:
                 if self.logger:
                     self.logger.log_error(
@@ -204,50 +352,57 @@ class Curiosity:
                         error_type="curiosity_prune_backup_error",
                         stack_trace=traceback.format_exc()
                     )
-        # Step 3: Remove items from cache under lock
+        # Step 3: Remove items from cache under lock; log after releasing it
         with self.lock:
             for key, _ in pruned_items:
-                if key in self.embedding_cache:
-                    del self.embedding_cache[key]
+                if self.embedding_cache.pop(key, None) is not None:
                     pruned_count += 1
-            if self.logger:
-                self.logger.record_event(
-                    event_type="embedding_cache_pruned",
-                    message=f"[MainThread] Pruned {pruned_count} embeddings from cache. Remaining: {len(self.embedding_cache)}",
-                    level="info",
-                    additional_info={
-                        "initial_cache_size": initial_cache_size,
-                        "pruned_count": pruned_count,
-                        "remaining": len(self.embedding_cache)
-                    }
-                )
+            remaining = len(self.embedding_cache)
+        if self.logger:
+            self.logger.record_event(
+                event_type="embedding_cache_pruned",
+                message=f"[MainThread] Pruned {pruned_count} embeddings from cache. Remaining: {remaining}",
+                level="info",
+                additional_info={
+                    "initial_cache_size": initial_cache_size,
+                    "pruned_count": pruned_count,
+                    "remaining": remaining
+                }
+            )
 
     def _background_prune_loop(self):
         """Background thread loop for cache pruning."""
-        while not self._prune_shutdown:
-            self._prune_event.wait()
-            while True:
-                # Step 1: Collect items to prune and backup under lock
-                with self.lock:
-                    if len(self.embedding_cache) <= self.embedding_cache_maxlen or self._prune_shutdown:
-                        break
-                    sorted_cache = sorted(
-                        self.embedding_cache.items(),
-                        key=lambda x: x[1].get('last_access', 0)
-                    )
-                    initial_cache_size = len(self.embedding_cache)
-                    prune_batch = self.embedding_cache_prune_batch
-                    prune_limit = min(prune_batch, initial_cache_size)
-                    pruned_items = sorted_cache[:prune_limit]
-                    pruned_count = 0
+        while True:
+            # Step 1: Sleep until the cache is over its cap (or shutdown), then snapshot it under the same lock
+            with self._prune_cv:
+                self._prune_cv.wait_for(
+                    lambda: self._prune_shutdown or len(self.embedding_cache) > self.embedding_cache_maxlen
+                )
+                if self._prune_shutdown:
+                    return
+                snapshot = list(self.embedding_cache.items())
+            initial_cache_size = len(snapshot)
+            total_pruned = 0
+            iterations = 0
+            # Drain in batches until back under the cap; totals are logged once per wakeup
+            while snapshot:
+                # Select prune candidates outside the lock
+                prune_limit = min(self.embedding_cache_prune_batch, len(snapshot))
+                pruned_items = heapq.nsmallest(
+                    prune_limit,
+                    snapshot,
+                    key=lambda x: x[1].get('last_access', 0)
+                )
                 # Step 2: Backup to file outside lock
                 if self.embedding_cache_backup_enabled and prune_limit > 0:
                     try:
                         backup_path = self.embedding_cache_backup_path
-                        with open(backup_path, "a", encoding="utf-8") as f:
-                            for key, value in pruned_items:
-                                json.dump({"key": key, "value": value}, f, default=str)
-                                f.write("\n")
+                        payload = "".join(
+                            json.dumps({"key": key, "value": value}, default=str) + "\n"
+                            for key, value in pruned_items
+                        )
+                        with open(backup_path, "a", encoding="utf-8", buffering=1 << 20) as f:
+                            f.write(payload)
                     except Exception as e:
                         if self.logger:
                             self.logger.log_error(
@@ -255,31 +410,35 @@ class Curiosity:
                                 error_type="curiosity_prune_backup_error",
                                 stack_trace=traceback.format_exc()
                             )
-                # Step 3: Remove items from cache under lock
+                # Step 3: Remove items under lock and, if still over the cap, take the next snapshot
                 with self.lock:
                     for key, _ in pruned_items:
-                        if key in self.embedding_cache:
-                            del self.embedding_cache[key]
-                            pruned_count += 1
-                    if self.logger:
-                        self.logger.record_event(
-                            event_type="embedding_cache_pruned",
-                            message=f"[Background] Pruned {pruned_count} embeddings from cache. Remaining: {len(self.embedding_cache)}",
-                            level="info",
-                            additional_info={
-                                "initial_cache_size": initial_cache_size,
-                                "pruned_count": pruned_count,
-                                "remaining": len(self.embedding_cache)
-                            }
-                        )
-                if len(self.embedding_cache) <= self.embedding_cache_maxlen or self._prune_shutdown:
-                    break
-            self._prune_event.clear()
+                        if self.embedding_cache.pop(key, None) is not None:
+                            total_pruned += 1
+                    remaining = len(self.embedding_cache)
+                    if self._prune_shutdown or remaining <= self.embedding_cache_maxlen or prune_limit == 0:
+                        snapshot = None
+                    else:
+                        snapshot = list(self.embedding_cache.items())
+                iterations += 1
+            if self.logger:
+                self.logger.record_event(
+                    event_type="embedding_cache_pruned",
+                    message=f"[Background] Pruned {total_pruned} embeddings from cache. Remaining: {remaining}",
+                    level="info",
+                    additional_info={
+                        "initial_cache_size": initial_cache_size,
+                        "pruned_count": total_pruned,
+                        "iterations": iterations,
+                        "remaining": remaining
+                    }
+                )
 
     def shutdown_prune_thread(self):
         """Cleanly shutdown the background pruning thread."""
-        self._prune_shutdown = True
-        self._prune_event.set()
+        with self._prune_cv:
+            self._prune_shutdown = True
+            self._prune_cv.notify_all()
         if self._prune_thread is not None:
             self._prune_thread.join()
 
@@ -316,6 +475,9 @@ class Curiosity:
         """Compute curiosity score based on novelty only."""
         try:
             memory_embeddings = self._get_valid_memory_embeddings(state)
+            if query_embedding is not None:
+                # Single host-to-device copy per query; the memory matrix is already cached on device
+                query_embedding = query_embedding.to(device, non_blocking=True)
             novelty = (
                 self._compute_novelty_score(memory_embeddings, query_embedding, device)
                 if memory_embeddings and query_embedding is not None
@@ -332,7 +494,7 @@ class Curiosity:
                     "memory_embeddings_count": len(memory_embeddings)
                 }
             )
-            return self._clamp_score(final_score)
+            return final_score
         except Exception as e:
             self._log_error(f"Curiosity computation failed: {str(e)}")
             return 0.5
@@ -340,16 +502,8 @@ class Curiosity:
     def _get_valid_memory_embeddings(self, state) -> List[torch.Tensor]:
         """Get valid memory embeddings with memory constraints."""
         try:
-            valid_embeddings = []
-            batch_size = self.batch_size
-
-            embeddings = state.embeddings
-
-            for i in range(0, len(embeddings), batch_size):
-                batch = embeddings[i:i + batch_size]
-                valid_embeddings.extend(batch)
-
-            return valid_embeddings
+            # Batched slicing here only rebuilt the same list; hand back the state's list without copying
+            return state.embeddings
         except Exception as e:
             self._log_error(f"Failed to get valid memory embeddings: {str(e)}")
             return []
@@ -360,41 +514,54 @@ class Curiosity:
         query_embedding: torch.Tensor,
         device: torch.device
     ) -> float:
-        """Compute novelty component of curiosity score using batched processing, with early exit and adaptive batch size."""
+        """Compute novelty component of curiosity score as 1 - max cosine similarity against all memories in one pass."""
         try:
-            query_embedding = query_embedding.to(device)
-            max_similarity = 0.0
-            batch_size = self._estimate_adaptive_batch_size()
-            for i in range(0, len(memory_embeddings), batch_size):
-                batch = memory_embeddings[i:i + batch_size]
-                batch_tensors = torch.stack([emb.to(device) for emb in batch])
-                similarities = self.cosine_similarity(
-                    query_embedding.unsqueeze(0),
-                    batch_tensors
-                )
-                batch_max = similarities.max().item()
-                max_similarity = max(max_similarity, batch_max)
-                # Early exit if high enough similarity is found
-                if max_similarity >= self.similarity_early_exit_threshold:
-                    break
-            return self._clamp_score(1.0 - max_similarity)
+            memory_matrix = self._get_unit_memory_matrix(memory_embeddings, device)
+            # Rows are unit length, so cosine similarity reduces to a single matrix-vector product
+            # Normalize at the query's own precision, then cast to the (possibly bf16) matrix dtype
+            query_unit = F.normalize(query_embedding.to(device), dim=-1, eps=1e-8).to(memory_matrix.dtype)
+            similarities = torch.mv(memory_matrix, query_unit)
+            # Clamp on device so the single .item() already yields a score in [0, 1]
+            max_similarity = similarities.max().clamp_(0.0, 1.0).item()
+            return 1.0 - max_similarity
         except Exception as e:
             self._log_error(f"Novelty score computation failed: {str(e)}")
             return 0.0
 
-    def _clamp_score(self, score: float) -> float:
-        """Clamp score between 0.0 and 1.0."""
-        return max(0.0, min(1.0, score))
+    def _get_unit_memory_matrix(self, memory_embeddings: List[torch.Tensor], device: torch.device) -> torch.Tensor:
+        """Stack and L2-normalize memory embeddings on device, reusing the result until the list changes.
+
+        Memories are append-only, so the length plus the identity of the first and last
+        tensors is enough to detect a change without hashing the contents.
+        """
+        source = (len(memory_embeddings), memory_embeddings[0], memory_embeddings[-1], str(device))
+        cached = self._memory_matrix_cache
+        if cached is not None:
+            key, matrix = cached
+            if (
+                key[0] == source[0]
+                and key[1] is source[1]
+                and key[2] is source[2]
+                and key[3] == source[3]
+            ):
+                return matrix
+        matrix = F.normalize(torch.stack(memory_embeddings).to(device), dim=-1, eps=1e-8)
+        if matrix.device.type == "cuda":
+            # Unit vectors tolerate bf16 well; halves GEMV bandwidth and uses tensor cores
+            matrix = matrix.to(torch.bfloat16)
+        self._memory_matrix_cache = (source, matrix)
+        return matrix
 
     def _log_error(self, message: str, **kwargs) -> None:
-        """Log error with standardized format."""
-        if self.logger:
-            self.logger.log_error(
-                error_msg=message,
-                error_type="curiosity_error",
-                stack_trace=traceback.format_exc(),
-                **kwargs
-            )
+        """Log error with standardized format; the traceback is only formatted while an exception is live."""
+        if not self.logger:
+            return
+        self.logger.log_error(
+            error_msg=message,
+            error_type="curiosity_error",
+            stack_trace=traceback.format_exc() if sys.exc_info()[0] is not None else None,
+            **kwargs
+        )
 
     def nudge_curiosity(self, amount: float):
         """
@@ -457,8 +624,9 @@ class CuriosityPressure:
             raise
             
         self.current_pressure = self.base_pressure
-        self.last_update = time.time()
-        self._last_eruption_time = 0.0
+        # Monotonic clock: elapsed-time math must not jump with wall-clock/NTP adjustments
+        self.last_update = time.monotonic()
+        self._last_eruption_time = float("-inf")
         self.cooldown = config.get("eruption_cooldown", 30.0)  # seconds, add to config if not present
         
         # Log initialization
@@ -503,7 +671,10 @@ class CuriosityPressure:
             raise
 
     def decay_pressure(self, current_time: float) -> None:
-        """Apply decay to current_pressure based on elapsed time and decay_rate."""
+        """Apply decay to current_pressure based on elapsed time and decay_rate.
+
+        current_time must come from time.monotonic(), the clock last_update is kept on.
+        """
         elapsed = current_time - self.last_update
         decay_factor = self.decay_rate * elapsed
         self.current_pressure = max(
@@ -527,7 +698,7 @@ class CuriosityPressure:
         Check if pressure exceeds threshold and cooldown has elapsed. If so, drop pressure and return True.
         Returns True if an eruption occurred, else False.
         """
-        now = time.time()
+        now = time.monotonic()
         self.decay_pressure(now)  # Apply decay before checking
         if self.current_pressure >= threshold and (now - self._last_eruption_time > self.cooldown):
             old_pressure = self.current_pressure
@@ -558,10 +729,12 @@ class CuriosityPressure:
 
     def _log_error(self, message: str, error_type: str = "curiosity_pressure_error", **kwargs) -> None:
         """Log error with standardized format."""
+        # Callers usually pass stack_trace already; don't format a second traceback as the default
+        stack_trace = kwargs["stack_trace"] if "stack_trace" in kwargs else traceback.format_exc()
         self.logger.log_error(
             error_msg=message,
             error_type=error_type,
-            stack_trace=kwargs.get("stack_trace", traceback.format_exc()),
+            stack_trace=stack_trace,
             additional_info=kwargs.get("additional_info", {})
         )
 
@@ -618,6 +791,8 @@ class CuriosityManager():
     """
     Handles calculation of curiosity scores, memory embeddings, and exploration decisions.
     """
+
+    _EMBEDDING_CACHE_SIZE = 4096  # Prompts memoized per embedding function
     
     def __init__(
         self,
@@ -638,6 +813,12 @@ class CuriosityManager():
         # Validate generation_manager
         if not hasattr(generation_manager, 'generate_text'):
             raise ValueError("generation_manager must have a 'generate_text' method")
+        # Optional collaborators attached after construction; defaulting them here lets
+        # the hot paths read plain attributes instead of probing with hasattr/getattr
+        self.session_id = None
+        self.recaller = None
+        self.temperament_system = None
+        self.context = None
         
         # Thread safety
         self._lock = threading.RLock()
@@ -669,7 +850,24 @@ class CuriosityManager():
         self.internal_threshold = self.curiosity_threshold * self.internal_threshold_factor
         self.max_internal_questions = curiosity_cfg.get("max_internal_questions", 20)
         self.internal_decay_seconds = curiosity_cfg.get("internal_decay_seconds", 3600)
-        self._internal_questions: Deque[Tuple[str, float, float]] = deque(maxlen=self.max_internal_questions)
+        # Time-ordered (question, score, timestamp, seq) buffer, plus a max-heap of
+        # (-score, seq, question, timestamp) over the same entries. Heap entries whose seq is no
+        # longer in _live_question_seqs (aged out, evicted, or already asked) are skipped lazily.
+        self._internal_questions: Deque[Tuple[str, float, float, int]] = deque(maxlen=self.max_internal_questions)
+        self._question_heap: List[Tuple[float, int, str, float]] = []
+        self._live_question_seqs: set = set()
+        self._question_seq = 0
+        # Unit-normalized seen-prompt embeddings, stacked once and rebuilt only when seen_prompts grows
+        self._seen_embeddings: Dict[str, torch.Tensor] = {}
+        self._seen_matrix: Optional[torch.Tensor] = None
+        self._seen_matrix_count = 0
+        # LRU memo of prompt -> embedding, one per embedding function (state manager, recaller)
+        # Keyed by (embed_fn, prompt): a swapped embedder or recaller misses instead of serving stale vectors
+        self._prompt_embedding_cache: "OrderedDict[Tuple[Any, str], Any]" = OrderedDict()
+        self._recall_embedding_cache: "OrderedDict[Tuple[Any, str], Any]" = OrderedDict()
+        self._embedding_cache_lock = threading.Lock()
+        # Read once: update_metrics runs per metric sample
+        self._metrics_maxlen = self.config_manager.get("metrics_maxlen", 1000)
         
         # Log initialization
         self._record_event(
@@ -681,6 +879,8 @@ class CuriosityManager():
                 "curiosity_threshold": self.curiosity_threshold
             }
         )
+        # Set last, so a partially constructed manager never reports itself as initialized
+        self._initialized = True
 
     def _initialize_config(self) -> None:
         """Initialize and validate configuration parameters."""
@@ -815,93 +1015,106 @@ class CuriosityManager():
     def _get_valid_memory_embeddings(self, state) -> List[torch.Tensor]:
         """Get valid memory embeddings with memory constraints."""
         try:
-            valid_embeddings = []
-            batch_size = self.curiosity.batch_size
-
-            embeddings = state.embeddings
-
-            for i in range(0, len(embeddings), batch_size):
-                batch = embeddings[i:i + batch_size]
-                valid_embeddings.extend(batch)
-
-            return valid_embeddings
+            # Batched slicing here only rebuilt the same list; hand back the state's list without copying
+            return state.embeddings
         except Exception as e:
             self._record_error(f"Failed to get valid memory embeddings: {str(e)}")
             return []
 
-    def _record_event(self, event_type: str, message: str, level: str = "info", **kwargs) -> None:
-        """Record event with standardized format (logs and sends to scribe)."""
+    def _record_event(
+        self,
+        event_type: str,
+        message: str,
+        level: str = "info",
+        additional_info: Optional[Dict[str, Any]] = None
+    ) -> None:
+        """Record event with standardized format (logs and sends to scribe) via the background writer."""
         if self.logger:
-            self.logger.log_event(
-                event_type=event_type,
-                message=message,
-                level=level,
-                **kwargs
-            )
-            # Also capture in scribe queue
-            capture_scribe_event(
-                origin="sovl_curiosity",
-                event_type=event_type,
-                event_data={
+            additional_info = additional_info or {}
+            self._emit(
+                _EMIT_EVENT,
+                {
+                    "event_type": event_type,
                     "message": message,
-                    **kwargs.get("additional_info", {})
-                },
-                source_metadata={
                     "level": level,
-                    "session_id": getattr(self, 'session_id', None)
+                    "additional_info": additional_info
                 },
-                session_id=getattr(self, 'session_id', None),
-                timestamp=datetime.now()
+                {
+                    "event_type": event_type,
+                    "event_data": {
+                        "message": message,
+                        **additional_info
+                    },
+                    "source_metadata": {
+                        "level": level,
+                        "session_id": self.session_id
+                    }
+                }
             )
 
     def _record_warning(self, event_type: str, message: str, **kwargs) -> None:
         """Log a warning with standardized format."""
-        self.logger.record_event(
-            event_type=event_type,
-            message=message,
-            level="warning",
-            additional_info=kwargs
-        )
+        _emit_async(_EMIT_EVENT, self.logger, {
+            "event_type": event_type,
+            "message": message,
+            "level": "warning",
+            "additional_info": kwargs
+        })
 
     def _record_error(self, message: str, **kwargs) -> None:
         """Record error with standardized format (logs and sends to scribe)."""
         if self.logger:
-            self.logger.log_error(
-                error_msg=message,
-                error_type="curiosity_error",
-                stack_trace=traceback.format_exc(),
-                **kwargs
-            )
-            # Also capture in scribe queue
-            capture_scribe_event(
-                origin="sovl_curiosity",
-                event_type="curiosity_error",
-                event_data={
-                    "error_message": message,
-                    "error_type": "curiosity_error",
-                    **kwargs
+            # Format the traceback once, here, and only if a caller didn't supply one and an
+            # exception is actually live; both sinks share it
+            # stack_trace and error_type have their own fields; only the rest is additional info
+            stack_trace = kwargs.pop("stack_trace", None)
+            error_type = kwargs.pop("error_type", "curiosity_error")
+            if stack_trace is None and sys.exc_info()[0] is not None:
+                stack_trace = traceback.format_exc()
+            self._emit(
+                _EMIT_ERROR,
+                {
+                    "error_msg": message,
+                    "error_type": error_type,
+                    "stack_trace": stack_trace,
+                    "additional_info": kwargs
                 },
-                source_metadata={
-                    "stack_trace": traceback.format_exc(),
-                    "session_id": getattr(self, 'session_id', None)
-                },
-                session_id=getattr(self, 'session_id', None),
-                timestamp=datetime.now()
+                {
+                    "event_type": "curiosity_error",
+                    "event_data": {
+                        "error_message": message,
+                        "error_type": error_type,
+                        **kwargs
+                    },
+                    "source_metadata": {
+                        "stack_trace": stack_trace,
+                        "session_id": self.session_id
+                    }
+                }
             )
 
+    def _emit(self, kind: str, log_kwargs: Dict[str, Any], scribe_kwargs: Dict[str, Any]) -> None:
+        """Queue one record for both the logger and the scribe as a single writer-thread item."""
+        scribe_kwargs["origin"] = "sovl_curiosity"
+        scribe_kwargs["session_id"] = self.session_id
+        _emit_async(kind, self.logger, log_kwargs, scribe_kwargs)
+
     def update_metrics(self, metric_name: str, value: float) -> bool:
         """Update curiosity metrics atomically in StateManager."""
         if not self.state_manager:
             raise RuntimeError("CuriosityManager requires a StateManager for state access.")
         try:
+            maxlen = self._metrics_maxlen
+
             def update_fn(state):
                 if not hasattr(state, "curiosity_metrics"):
-                    from collections import defaultdict
                     state.curiosity_metrics = defaultdict(list)
-                state.curiosity_metrics[metric_name].append(value)
-                maxlen = self.config_manager.get("metrics_maxlen")
-                if len(state.curiosity_metrics[metric_name]) > maxlen:
-                    state.curiosity_metrics[metric_name] = state.curiosity_metrics[metric_name][-maxlen:]
+                series = state.curiosity_metrics.get(metric_name)
+                # Bounded deque trims in O(1); lists restored from saved state are converted once
+                if not isinstance(series, deque) or series.maxlen != maxlen:
+                    series = deque(series or (), maxlen=maxlen)
+                    state.curiosity_metrics[metric_name] = series
+                series.append(value)
                 return state
             self.state_manager.update_state_atomic(update_fn)
             return True
@@ -921,14 +1134,61 @@ class CuriosityManager():
         seen_prompts = getattr(state, 'seen_prompts', [])
         if not seen_prompts:
             return 1.0
-        similarities = [
-            cosine_similarity(
-                self.state_manager.get_prompt_embedding(prompt),
-                self.state_manager.get_prompt_embedding(seen)
-            )
-            for seen in seen_prompts
-        ]
-        return 1.0 - max(similarities) if similarities else 1.0
+        seen_matrix = self._get_seen_prompt_matrix(seen_prompts)
+        query = F.normalize(
+            self._prompt_embedding(prompt).reshape(-1).float(), dim=-1, eps=1e-8
+        ).to(seen_matrix.device, seen_matrix.dtype)
+        # Rows and query are unit length, so one GEMV yields every cosine similarity
+        return 1.0 - torch.mv(seen_matrix, query).max().clamp_(-1.0, 1.0).item()
+
+    def _get_seen_prompt_matrix(self, seen_prompts) -> torch.Tensor:
+        """Return the (N, D) unit embedding matrix of seen prompts, embedding only prompts not cached yet."""
+        # Length alone is not enough: a loaded or reset state can swap in a different set of the same size.
+        # Comparing against the cached keys is a C-level set compare, only paid when the lengths agree.
+        if (
+            self._seen_matrix is None
+            or self._seen_matrix_count != len(seen_prompts)
+            or self._seen_embeddings.keys() != seen_prompts
+        ):
+            previous = self._seen_embeddings
+            embeddings: Dict[str, torch.Tensor] = {}
+            for seen in seen_prompts:
+                row = previous.get(seen)
+                if row is None:
+                    row = F.normalize(
+                        self._prompt_embedding(seen).reshape(-1).float(), dim=-1, eps=1e-8
+                    )
+                embeddings[seen] = row
+            self._seen_embeddings = embeddings
+            seen_matrix = torch.stack(list(embeddings.values()))
+            if seen_matrix.device.type == "cuda":
+                # Same trade-off as Curiosity's memory matrix: unit rows in bf16 halve GEMV bandwidth
+                seen_matrix = seen_matrix.to(torch.bfloat16)
+            self._seen_matrix = seen_matrix
+            self._seen_matrix_count = len(seen_prompts)
+        return self._seen_matrix
+
+    def _prompt_embedding(self, prompt: str) -> torch.Tensor:
+        """Memoized state_manager.get_prompt_embedding."""
+        return self._cached_embedding(
+            self._prompt_embedding_cache, self.state_manager.get_prompt_embedding, prompt
+        )
+
+    def _cached_embedding(self, cache: "OrderedDict[Tuple[Any, str], Any]", embed_fn, prompt: str) -> Any:
+        """Return embed_fn(prompt) from the given LRU, embedding (outside the lock) only on a miss."""
+        # Bound methods compare equal when they share the instance and function, so the key is stable
+        key = (embed_fn, prompt)
+        with self._embedding_cache_lock:
+            embedding = cache.get(key)
+            if embedding is not None:
+                cache.move_to_end(key)
+                return embedding
+        embedding = embed_fn(prompt)
+        with self._embedding_cache_lock:
+            cache[key] = embedding
+            if len(cache) > self._EMBEDDING_CACHE_SIZE:
+                cache.popitem(last=False)
+        return embedding
 
     def _calculate_ignorance(self, prompt: str) -> float:
         """Calculate ignorance as 1.0 - similarity to best long-term memory match."""
@@ -936,12 +1196,14 @@ class CuriosityManager():
             raise RuntimeError("CuriosityManager requires a StateManager for state access.")
         try:
             # Ensure recaller is available
-            if not hasattr(self, 'recaller') or self.recaller is None:
+            if self.recaller is None:
                 if self.logger:
                     self.logger.log_error("No recaller (DialogueContextManager) available for ignorance calculation.")
                 return 1.0
             # Get embedding for the prompt
-            query_embedding = self.recaller.embedding_fn(prompt)
+            query_embedding = self._cached_embedding(
+                self._recall_embedding_cache, self.recaller.embedding_fn, prompt
+            )
             # Query long-term memory for top match
             results = self.recaller.get_long_term_context(query_embedding=query_embedding, top_k=1)
             if not results or 'embedding' not in results[0]:
@@ -952,15 +1214,15 @@ class CuriosityManager():
                 similarity = cosine_similarity(query_embedding, best_embedding)
                 ignorance = 1.0 - similarity
                 ignorance = max(0.0, min(1.0, ignorance))
-            self.logger.log_event(
-                event_type="ignorance_calculated",
-                message="Ignorance calculated for prompt (retrieval-based)",
-                additional_info={
+            _emit_async(_EMIT_EVENT, self.logger, {
+                "event_type": "ignorance_calculated",
+                "message": "Ignorance calculated for prompt (retrieval-based)",
+                "additional_info": {
                     "prompt": prompt,
                     "ignorance": ignorance,
                     "method": "retrieval_confidence"
                 }
-            )
+            })
             return ignorance
         except Exception as e:
             if self.logger:
@@ -971,16 +1233,16 @@ class CuriosityManager():
         novelty_score = self._calculate_novelty(prompt)
         ignorance_score = self._calculate_ignorance(prompt)
         curiosity_score = 0.5 * novelty_score + 0.5 * ignorance_score
-        self.logger.log_event(
-            event_type="curiosity_computed",
-            message="Curiosity score computed",
-            additional_info={
+        _emit_async(_EMIT_EVENT, self.logger, {
+            "event_type": "curiosity_computed",
+            "message": "Curiosity score computed",
+            "additional_info": {
                 "prompt": prompt,
                 "curiosity_score": curiosity_score,
                 "novelty": novelty_score,
                 "ignorance": ignorance_score
             }
-        )
+        })
         return curiosity_score
 
     def _summarize_knowns(self, prompt: str) -> str:
@@ -993,15 +1255,9 @@ class CuriosityManager():
         seen_prompts = getattr(state, 'seen_prompts', [])
         if not seen_prompts:
             return "Prompt is new to the system."
-        # Use Counter for large lists
-        if len(seen_prompts) > 1000:
-            from collections import Counter
-            prompt_counts = Counter(seen_prompts)
-            count = prompt_counts.get(prompt, 0)
-        else:
-            count = seen_prompts.count(prompt)
-        if count > 0:
-            return f"Prompt has been seen {count} times."
+        # seen_prompts is a set: membership is O(1) and a prompt is recorded at most once
+        if prompt in seen_prompts:
+            return "Prompt has been seen before."
         return "Prompt is new to the system."
 
     def _summarize_unknowns(self, prompt: str) -> str:
@@ -1052,36 +1308,42 @@ class CuriosityManager():
         "   - Output only the question, with no preamble or explanation.\n"
         "   - If you understand, reply with only the curiosity question."
     )
+    # Length of the template with every field empty; lets the 2000-char cap be checked before formatting
+    _curiosity_prompt_base_len = len(curiosity_prompt_template.format(context="", knowns="", unknowns=""))
 
     def summarize_context(self, context, max_sentences=2):
         """Return the last N sentences from the context string."""
         if not isinstance(context, str) or not context.strip():
             return "No context provided."
-        sentences = [s.strip() for s in context.split('.') if s.strip()]
-        summary = '. '.join(sentences[-max_sentences:]) + ('.' if sentences else '')
+        # Walk back from the end so only the kept sentences are ever sliced out
+        sentences = []
+        end = len(context)
+        while len(sentences) < max_sentences and end >= 0:
+            start = context.rfind('.', 0, end) + 1
+            sentence = context[start:end].strip()
+            if sentence:
+                sentences.append(sentence)
+            end = start - 1
+        sentences.reverse()
+        summary = '. '.join(sentences) + ('.' if sentences else '')
         return summary
 
     def build_curiosity_prompt(self, context, knowns, unknowns):
         context_summary = self.summarize_context(context)
         knowns_summary = '; '.join(knowns[:3])
         unknowns_summary = '; '.join(unknowns[:3])
-        prompt = self.curiosity_prompt_template.format(
+        # Formatting only substitutes the fields, so the final length is known up front
+        if self._curiosity_prompt_base_len + len(context_summary) + len(knowns_summary) + len(unknowns_summary) > 2000:
+            context_summary = self.summarize_context(context, max_sentences=1)
+        return self.curiosity_prompt_template.format(
             context=context_summary,
             knowns=knowns_summary,
             unknowns=unknowns_summary
         )
-        if len(prompt) > 2000:
-            context_summary = self.summarize_context(context, max_sentences=1)
-            prompt = self.curiosity_prompt_template.format(
-                context=context_summary,
-                knowns=knowns_summary,
-                unknowns=unknowns_summary
-            )
-        return prompt
 
     def _build_question(self, meta_prompt: str, score: float) -> Optional[str]:
         """Helper to generate a single question using the generation manager. Logs and propagates errors if generation_manager fails."""
-        if not hasattr(self, 'generation_manager') or not hasattr(self.generation_manager, 'generate_text'):
+        if not hasattr(self.generation_manager, 'generate_text'):
             if self.logger:
                 self.logger.log_error("CuriosityManager: generation_manager is missing or does not have generate_text.", error_type="curiosity_generation_manager_missing")
             return None
@@ -1098,94 +1360,147 @@ class CuriosityManager():
                 self.logger.log_error(f"CuriosityManager: Exception in generate_text: {e}", error_type="curiosity_generation_failed")
             return None
 
-    def _maybe_generate_internal_question(self, prompt: str, context: str = None) -> None:
-        """Continuously generate and store internal questions at the lower threshold."""
+    def _push_internal_question(self, question: str, score: float, timestamp: float) -> None:
+        """Buffer a question in both the time-ordered deque and the score heap."""
+        questions = self._internal_questions
+        if questions.maxlen is not None and len(questions) >= questions.maxlen:
+            if not questions:
+                return  # Zero-capacity buffer
+            # The append below evicts the oldest entry; retire its seq first
+            self._live_question_seqs.discard(questions[0][3])
+        seq = self._question_seq
+        self._question_seq += 1
+        questions.append((question, score, timestamp, seq))
+        self._live_question_seqs.add(seq)
+        heapq.heappush(self._question_heap, (-score, seq, question, timestamp))
+        # Retired entries are only dropped lazily; compact before the heap outgrows the buffer
+        if len(self._question_heap) > 2 * max(len(questions), 1):
+            live = self._live_question_seqs
+            self._question_heap = [entry for entry in self._question_heap if entry[1] in live]
+            heapq.heapify(self._question_heap)
+
+    def _expire_internal_questions(self, cutoff: float) -> None:
+        """Drop buffered questions older than cutoff; appends are time-ordered, so they sit at the left."""
+        questions = self._internal_questions
+        while questions and questions[0][2] < cutoff:
+            self._live_question_seqs.discard(questions.popleft()[3])
+
+    def _best_internal_question(self) -> Optional[Tuple[str, float, float]]:
+        """Peek the highest-scoring live buffered question (earliest wins ties), or None if empty."""
+        heap = self._question_heap
+        live = self._live_question_seqs
+        while heap and heap[0][1] not in live:
+            heapq.heappop(heap)
+        if not heap:
+            return None
+        neg_score, _, question, timestamp = heap[0]
+        return question, -neg_score, timestamp
+
+    def _pop_best_internal_question(self) -> Optional[Tuple[str, float, float]]:
+        """Remove and return the best buffered question, leaving the runners-up for later eruptions."""
+        best = self._best_internal_question()
+        if best is None:
+            return None
+        seq = heapq.heappop(self._question_heap)[1]
+        self._live_question_seqs.discard(seq)
+        questions = self._internal_questions
+        for index, entry in enumerate(questions):
+            if entry[3] == seq:
+                del questions[index]
+                break
+        return best
+
+    def _clear_internal_questions(self) -> None:
+        """Drop every buffered question."""
+        self._internal_questions.clear()
+        self._question_heap.clear()
+        self._live_question_seqs.clear()
+
+    def _maybe_generate_internal_question(self, prompt: str, context: str = None) -> float:
+        """Continuously generate and store internal questions at the lower threshold.
+
+        Returns the prompt's curiosity score so callers don't have to compute it again.
+        """
         score = self.calculate_curiosity_score(prompt)
         # Update pressure based on curiosity score
-        old_pressure = self.curiosity_pressure.current_pressure
+        pressure = self.curiosity_pressure
+        old_pressure = pressure.current_pressure
         increment = score * 0.1  # Tune as needed
-        self.curiosity_pressure.current_pressure = min(
-            self.curiosity_pressure.max_pressure,
-            self.curiosity_pressure.current_pressure + increment
-        )
+        new_pressure = min(pressure.max_pressure, old_pressure + increment)
+        pressure.current_pressure = new_pressure
         if self.logger:
-            self.logger.log_event(
-                event_type="curiosity_pressure_updated",
-                message=f"Curiosity pressure increased by {increment:.4f} (from {old_pressure:.4f} to {self.curiosity_pressure.current_pressure:.4f})",
-                additional_info={
+            _emit_async(_EMIT_EVENT, self.logger, {
+                "event_type": "curiosity_pressure_updated",
+                "message": f"Curiosity pressure increased by {increment:.4f} (from {old_pressure:.4f} to {new_pressure:.4f})",
+                "additional_info": {
                     "old_pressure": old_pressure,
                     "increment": increment,
-                    "new_pressure": self.curiosity_pressure.current_pressure,
+                    "new_pressure": new_pressure,
                     "score": score
                 }
-            )
+            })
         now = time.time()
         # Prune old entries by age
-        cutoff = now - self.internal_decay_seconds
-        self._internal_questions = deque(
-            [(q, s, t) for q, s, t in self._internal_questions if t >= cutoff],
-            maxlen=self.max_internal_questions
-        )
-        if score >= self.internal_threshold and hasattr(self, 'generation_manager'):
+        self._expire_internal_questions(now - self.internal_decay_seconds)
+        if score >= self.internal_threshold:
             knowns = [self._summarize_knowns(prompt)]
             unknowns = [self._summarize_unknowns(prompt)]
             meta = self.build_curiosity_prompt(context or prompt, knowns, unknowns)
             q = self._build_question(meta, score)
             if q:
-                self._internal_questions.append((q, score, now))
+                self._push_internal_question(q, score, now)
                 try:
                     novelty_score = self.calculate_curiosity_score(q)
-                    current_mood_label = getattr(self.temperament_system, "current_mood", "unknown") if hasattr(self, "temperament_system") else "unknown"
-                    current_temperament_score = getattr(self.temperament_system, "current_score", "unknown") if hasattr(self, "temperament_system") else "unknown"
-                    current_lifecycle_stage = getattr(self.context, "current_lifecycle_stage", "unknown") if hasattr(self, "context") else "unknown"
-                    session_id = getattr(self, 'session_id', None)
-                    capture_scribe_event(
-                        origin="sovl_curiosity",
-                        event_type="internal_curiosity_question",
-                        event_data={
+                    temperament_system = self.temperament_system
+                    current_mood_label = getattr(temperament_system, "current_mood", "unknown")
+                    current_temperament_score = getattr(temperament_system, "current_score", "unknown")
+                    current_lifecycle_stage = getattr(self.context, "current_lifecycle_stage", "unknown")
+                    session_id = self.session_id
+                    _emit_async(_EMIT_SCRIBE, scribe={
+                        "origin": "sovl_curiosity",
+                        "event_type": "internal_curiosity_question",
+                        "event_data": {
                             "question": q,
                             "curiosity_score": score,
                             "timestamp_unix": now,
                         },
-                        source_metadata={
+                        "source_metadata": {
                             "novelty_score": novelty_score,
                             "current_mood_label": current_mood_label,
                             "current_temperament_score": current_temperament_score,
                             "current_lifecycle_stage": current_lifecycle_stage,
                             "session_id": session_id,
                         },
-                        session_id=session_id,
-                        timestamp=datetime.fromtimestamp(now)
-                    )
+                        "session_id": session_id
+                    }, unix_time=now)
                 except Exception as e:
                     self.logger.log_error(f"Curiosity: failed to scribe internal question: {e}")
+        return score
 
     def generate_curiosity_question(self, prompt: str, context: str = None) -> Optional[str]:
         """Two-stage curiosity: buffer private Qs and erupt highest when threshold reached."""
-        # 1) Always attempt to buffer an internal question
-        self._maybe_generate_internal_question(prompt, context)
+        # 1) Always attempt to buffer an internal question; this also scores the prompt
+        curiosity_score = self._maybe_generate_internal_question(prompt, context)
 
-        # 2) Compute current curiosity score and check eruption threshold
-        curiosity_score = self.calculate_curiosity_score(prompt)
+        # 2) Check the eruption threshold against that same score
         if curiosity_score < self.curiosity_threshold:
             return None
 
-        # 3) Pick the highest‐scoring buffered question and clear buffer
-        if not self._internal_questions:
+        # 3) Pop the highest‐scoring buffered question; the rest stay buffered for later eruptions
+        best = self._pop_best_internal_question()
+        if best is None:
             return None
-        q, q_score, _ = max(self._internal_questions, key=lambda x: x[1])
-        self._internal_questions.clear()
+        q, q_score, _ = best
 
         # 4) Scribe the user‐facing question
         try:
-            capture_scribe_event(
-                origin="sovl_curiosity",
-                event_type="curiosity_question_asked",
-                event_data={"question": q, "curiosity_score": q_score},
-                source_metadata={"module": "CuriosityManager"},
-                session_id=getattr(self, 'session_id', None),
-                timestamp=datetime.now()
-            )
+            _emit_async(_EMIT_SCRIBE, scribe={
+                "origin": "sovl_curiosity",
+                "event_type": "curiosity_question_asked",
+                "event_data": {"question": q, "curiosity_score": q_score},
+                "source_metadata": {"module": "CuriosityManager"},
+                "session_id": self.session_id
+            })
         except Exception as e:
             self.logger.log_error(f"Curiosity: failed to scribe asked question: {e}")
 
@@ -1287,9 +1602,10 @@ class CuriosityManager():
 
         fallback = False
         with self._lock:
-            if self._internal_questions:
-                best_question, q_score, _ = max(self._internal_questions, key=lambda x: x[1])
-                self._internal_questions.clear()
+            best = self._best_internal_question()
+            if best is not None:
+                best_question, q_score, _ = best
+                self._clear_internal_questions()
             else:
                 # Fallback: use last prompt or skip
                 last_prompt = self.state_manager.get_last_prompt() if self.state_manager and hasattr(self.state_manager, 'get_last_prompt') else None
@@ -1299,7 +1615,7 @@ class CuriosityManager():
                         message="No internal questions or recent context available for fallback question."
                     )
                     return None
-                if not hasattr(self, 'generation_manager') or not hasattr(self.generation_manager, 'generate_text'):
+                if not hasattr(self.generation_manager, 'generate_text'):
                     self._record_error(
                         message="No generation_manager for fallback question",
                         error_type="generation_manager_missing"
@@ -1331,27 +1647,36 @@ class CuriosityManager():
             user_response = input().strip()
         except (EOFError, KeyboardInterrupt):
             user_response = ""
-        # Log the asked question and user response
-        capture_scribe_event(
-            origin="sovl_curiosity",
-            event_type="curiosity_question_user",
-            event_data={
+        # Log the asked question and user response; one clock read serves both timestamps
+        now = time.time()
+        _emit_async(_EMIT_SCRIBE, scribe={
+            "origin": "sovl_curiosity",
+            "event_type": "curiosity_question_user",
+            "event_data": {
                 "question": best_question,
                 "user_response": user_response,
                 "spontaneous": spontaneous,
                 "curiosity_score": q_score,
                 "fallback": fallback,
-                "timestamp_unix": time.time(),
-                "session_id": getattr(self, 'session_id', None)
+                "timestamp_unix": now,
+                "session_id": self.session_id
             },
-            source_metadata={
+            "source_metadata": {
                 "module": "CuriosityManager",
-                "session_id": getattr(self, 'session_id', None)
+                "session_id": self.session_id
             },
-            session_id=getattr(self, 'session_id', None)
-        )
+            "session_id": self.session_id
+        }, unix_time=now)
         return user_response
 
+    async def ask_user_curiosity_question_async(self, spontaneous: bool = False) -> Optional[str]:
+        """
+        Awaitable ask_user_curiosity_question. Fallback generation and the blocking input() run
+        on the loop's default executor, so the event loop stays responsive while the user answers.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.ask_user_curiosity_question, spontaneous)
+
     def output_curiosity_utterance(self, text: str) -> None:
         """Outputs the curiosity utterance using the unified output function (no labels)."""
         output_response(text)
@@ -1361,24 +1686,25 @@ class CuriosityManager():
         return self.compute_curiosity(state, **kwargs)
 
     def compute_curiosity(self, state: 'StateManager', **kwargs) -> float:
+        # Only the scoring call can fail; the blend and clamp below are plain float arithmetic
         try:
-            vibe_profile = kwargs.get("vibe_profile", None)
             curiosity_score = self.calculate_curiosity_score(kwargs.get("prompt", None))
-            if vibe_profile and hasattr(vibe_profile, "dimensions"):
-                curiosity_score = (
-                    0.5 * curiosity_score +
-                    0.5 * vibe_profile.dimensions.get("curiosity", 0.5)
-                )
-            return max(0.0, min(1.0, curiosity_score))
         except Exception as e:
             self.logger.log_error(
                 error_msg=f"Failed to compute curiosity: {str(e)}",
                 error_type="curiosity_computation_error",
-                stack_trace=traceback.format_exc()
+                exc_info=True
             )
             if hasattr(self, 'error_manager') and self.error_manager:
                 self.error_manager.handle_data_error(e, {"state": str(state)}, "curiosity_computation")
             return 0.5  # Default fallback
+        # Most calls carry no vibe profile: test identity first and skip the attribute probe
+        vibe_profile = kwargs.get("vibe_profile")
+        if vibe_profile is not None:
+            dimensions = getattr(vibe_profile, "dimensions", None)
+            if dimensions is not None:
+                curiosity_score = 0.5 * curiosity_score + 0.5 * dimensions.get("curiosity", 0.5)
+        return 0.0 if curiosity_score < 0.0 else 1.0 if curiosity_score > 1.0 else curiosity_score
 
     def get_novelty_score(self, prompt: str) -> float:
         try:
@@ -1387,30 +1713,23 @@ class CuriosityManager():
             self.logger.log_error(
                 error_msg=f"Failed to compute novelty score: {str(e)}",
                 error_type="novelty_score_error",
-                stack_trace=traceback.format_exc()
+                exc_info=True
             )
             return 0.5  # Default fallback
 
     def is_initialized(self) -> bool:
         """Check if CuriosityManager is properly initialized."""
-        return all(hasattr(self, attr) for attr in ["config_manager", "logger", "error_manager", "state_manager"])
+        return getattr(self, "_initialized", False)
 
 # Utility for validating usage percentage
 @staticmethod
 def _validate_usage_percentage(val, manager_name, logger=None):
-    try:
-        if not isinstance(val, (int, float)) or not (0 <= val <= 100):
-            if logger:
-                logger.log_error(
-                    error_msg=f"Invalid usage_percentage from {manager_name}: {val}",
-                    error_type="curiosity_memory_manager_validation_error"
-                )
-            return False
-        return True
-    except Exception as e:
+    # isinstance plus a chained numeric comparison cannot raise, so no try block is needed
+    if not isinstance(val, (int, float)) or not (0 <= val <= 100):
         if logger:
             logger.log_error(
-                error_msg=f"Exception validating usage_percentage from {manager_name}: {e}",
+                error_msg=f"Invalid usage_percentage from {manager_name}: {val}",
                 error_type="curiosity_memory_manager_validation_error"
             )
-        return False
\ No newline at end of file
+        return False
+    return True
\ No newline at end of file
@@ -1,4 +1,5 @@
 import torch
+import re
 import time
 import threading
 from collections import deque, defaultdict
@@ -19,6 +20,10 @@ from sovl_manager import ModelManager
 from sovl_primer import GenerationPrimer  
 from sovl_resource import ResourceManager
 
+# Prompt sanitization patterns, compiled once rather than per generate_text call
+_CONTROL_CHARS_RE = re.compile(r'[\x00-\x1f\x7f-\x9f]')
+_WHITESPACE_RE = re.compile(r'\s+')
+
 class GenerationError(Exception):
     """Raised when text generation fails in a way that should halt upstream processing."""
     pass
@@ -555,9 +560,8 @@ class GenerationManager:
                 error_type="invalid_prompt_type"
             )
             raise ValueError("Prompt must be a string.")
-        import re
-        prompt = re.sub(r'[\x00-\x1f\x7f-\x9f]', '', prompt)
-        prompt = re.sub(r'\s+', ' ', prompt).strip()
+        prompt = _CONTROL_CHARS_RE.sub('', prompt)
+        prompt = _WHITESPACE_RE.sub(' ', prompt).strip()
         max_prompt_length = 1024
         if len(prompt) > max_prompt_length:
             self.logger.log_warning(
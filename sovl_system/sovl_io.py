@@ -1,6 +1,9 @@
 import json
 import os
-import gzip
+try:
+    from isal import igzip as gzip  # ISA-L accelerated, drop-in gzip API
+except ImportError:
+    import gzip
 import sys
 import logging
 import threading
@@ -920,8 +923,6 @@ def count_jsonl_entries(file_path: str) -> int:
     Count the number of entries (lines) in a JSONL file. Supports .jsonl and .jsonl.gz files.
     Returns 0 if the file does not exist.
     """
-    import gzip
-    import os
     if not os.path.exists(file_path):
         return 0
     open_func = gzip.open if file_path.endswith('.gz') else open
@@ -1,6 +1,10 @@
 import json
 import os
-import gzip
+import shutil
+try:
+    from isal import igzip as gzip  # ISA-L accelerated, drop-in gzip API
+except ImportError:
+    import gzip
 import uuid
 import time
 import logging
@@ -15,6 +19,8 @@ from sovl_records import ErrorRecordBridge, IErrorHandler, ErrorRecord
 
 LOGGING_ENABLED = True  # Universal on/off switch for all logging
 
+_GZIP_COPY_BUFFER = 1024 * 1024  # Chunk size for streaming logs into gzip
+
 # Utility to set LOGGING_ENABLED from config
 
 def set_logging_enabled_from_config(config_manager: ConfigManager):
@@ -204,7 +210,7 @@ class _FileHandler:
                 rotated_file += ".gz"
                 with self.safe_file_op(open, self.config.log_file, 'rb') as f_in:
                     with self.safe_file_op(gzip.open, rotated_file, 'wb') as f_out:
-                        f_out.writelines(f_in)
+                        shutil.copyfileobj(f_in, f_out, _GZIP_COPY_BUFFER)
             else:
                 self.safe_file_op(os.rename, self.config.log_file, rotated_file)
 
@@ -221,7 +227,7 @@ class _FileHandler:
         try:
             with self.safe_file_op(open, self.config.log_file, 'rb') as f_in:
                 with self.safe_file_op(gzip.open, compressed_file, 'wb') as f_out:
-                    f_out.writelines(f_in)
+                    shutil.copyfileobj(f_in, f_out, _GZIP_COPY_BUFFER)
 
             if not keep_original:
                 self.safe_file_op(os.remove, self.config.log_file)
@@ -401,6 +407,38 @@ class Logger(IErrorHandler):
                 self._fallback_logger.error(f"Failed to record event: {str(e)}")
                 self._fallback_logger.error(traceback.format_exc())
     
+    def record_events(self, events: List[Dict[str, Any]]) -> None:
+        """
+        Record several general events with one lock acquisition and one batch write.
+        Each item holds record_event keyword arguments (event_type, message, level, additional_info)
+        plus an optional "timestamp" (time.time() value taken when the event happened); events
+        without one are stamped now.
+        """
+        if not LOGGING_ENABLED or not events:
+            return
+        with self._lock:
+            try:
+                log_entries = []
+                for event in events:
+                    level = event.get("level", "info")
+                    if not self.should_log(level):
+                        continue
+                    unix_time = event.get("timestamp")
+                    timestamp = datetime.now() if unix_time is None else datetime.fromtimestamp(unix_time)
+                    log_entries.append({
+                        'timestamp': timestamp.isoformat(),
+                        'conversation_id': str(uuid.uuid4()),
+                        'event_type': event["event_type"],
+                        'message': event["message"],
+                        'level': level,
+                        **(event.get("additional_info") or {})
+                    })
+                # write_batch validates each entry and skips invalid ones
+                self._file_handler.write_batch(log_entries)
+            except Exception as e:
+                self._fallback_logger.error(f"Failed to record events: {str(e)}")
+                self._fallback_logger.error(traceback.format_exc())
+    
     def handle_error(self, record: ErrorRecord) -> None:
         """Handle error records from the ErrorRecordBridge."""
         if not LOGGING_ENABLED or not self.should_log("ERROR"):
@@ -427,10 +465,16 @@ class Logger(IErrorHandler):
                 self._fallback_logger.error(f"Failed to handle error: {str(e)}")
                 self._fallback_logger.error(traceback.format_exc())
     
-    def log_error(self, error_msg: str, error_type: str = None, stack_trace: str = None, additional_info: Dict[str, Any] = None) -> None:
-        """Log an error with detailed information."""
+    def log_error(self, error_msg: str, error_type: str = None, stack_trace: str = None, additional_info: Dict[str, Any] = None, exc_info: bool = False) -> None:
+        """Log an error with detailed information.
+
+        Pass exc_info=True from an except block instead of stack_trace=traceback.format_exc():
+        the traceback is then only formatted when the error will actually be recorded.
+        """
         if not LOGGING_ENABLED:
             return
+        if stack_trace is None and exc_info and self.should_log("ERROR"):
+            stack_trace = traceback.format_exc()
         with self._lock:
             # Record through the bridge
             ErrorRecordBridge().record_error(
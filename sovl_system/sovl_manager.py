@@ -88,6 +88,7 @@ class ModelManager:
         self._memory_lock = RLock()
         self._gpu_lock = Lock()  # Add dedicated GPU lock
         self._last_failed_recovery_key = None  # Track last failed recovery attempt
+        self._model_size_cache: Dict[str, int] = {}  # Estimated size (MB) per model name
         self.components = {}  # For compatibility with other modules
 
         # Initialize error manager FIRST
@@ -371,13 +372,20 @@ class ModelManager:
 
     def _estimate_model_size(self, model_name: str) -> int:
         """Estimate model size in MB for resource acquisition."""
+        # Sizing instantiates a full dummy model, so reuse the result across reloads
+        cached = self._model_size_cache.get(model_name)
+        if cached is not None:
+            return cached
         try:
             config = AutoConfig.from_pretrained(model_name)
             dummy_model = AutoModelForCausalLM.from_config(config)
             param_count = sum(p.numel() for p in dummy_model.parameters())
+            del dummy_model
             # Assume fp16 (2 bytes per param) unless quantization is known
             size_bytes = param_count * 2
-            return size_bytes // (1024 * 1024)
+            size_mb = size_bytes // (1024 * 1024)
+            self._model_size_cache[model_name] = size_mb
+            return size_mb
         except Exception as e:
             self._log_error(
                 f"Failed to estimate model size for {model_name}: {str(e)}",
@@ -4,7 +4,6 @@ from typing import Optional, Dict, Any, Union
 import torch
 import time
 import traceback
-from transformers import AutoConfig
 from sovl_logger import Logger, LoggerConfig
 from sovl_error import ErrorManager
 
@@ -258,9 +258,9 @@ class CuriosityConfig:
     embedding_cache_backup_enabled: bool = False  # Enable backup of pruned embeddings
     embedding_cache_backup_path: str = "embedding_cache_backup.jsonl"  # Path for embedding cache backup
     background_pruning_enabled: bool = True  # Enable background pruning of embedding cache
-    similarity_early_exit_threshold: float = 0.99  # Early exit threshold for similarity checks
-    adaptive_batch_min: int = 8  # Minimum adaptive batch size
-    adaptive_batch_max: int = 128  # Maximum adaptive batch size
+    similarity_early_exit_threshold: float = 0.99  # Deprecated: unused since novelty is scored in one pass
+    adaptive_batch_min: int = 8  # Deprecated: unused since novelty is scored in one pass
+    adaptive_batch_max: int = 128  # Deprecated: unused since novelty is scored in one pass
 
     # Curiosity pressure system
     base_pressure: float = 0.5  # Base pressure value
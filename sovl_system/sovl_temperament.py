@@ -1,5 +1,5 @@
 import time
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple
 from dataclasses import dataclass
 import traceback
 from sovl_config import ConfigManager
@@ -15,10 +15,36 @@ import queue
 import random
 from sovl_queue import capture_scribe_event
 
+# Default mood label boundaries (overridable via temperament_config)
+_MOOD_CAUTIOUS_THRESHOLD = -0.3
+_MOOD_CURIOUS_THRESHOLD = 0.3
+
 @dataclass
 class TemperamentConfig:
     """Configuration for the temperament system."""
     
+    # Only the manager reference is per-instance; no __dict__ needed
+    __slots__ = ("config_manager",)
+
+    # Required keys and their validation ranges, shared by all instances
+    _REQUIRED_KEYS = (
+        ("temperament_config.mood_influence", 0.0, 1.0),
+        ("temperament_config.history_maxlen", 3, 10),
+        ("temperament_config.temp_eager_threshold", 0.7, 0.9),
+        ("temperament_config.temp_sluggish_threshold", 0.3, 0.6),
+        ("temperament_config.temp_mood_influence", 0.0, 1.0),
+        ("temperament_config.temp_restless_drop", 0.0, 0.5),
+        ("temperament_config.temp_melancholy_noise", 0.0, 0.1),
+        ("temperament_config.conf_feedback_strength", 0.0, 1.0),
+        ("temperament_config.temp_smoothing_factor", 0.0, 1.0),
+        ("temperament_config.temperament_decay_rate", 0.0, 1.0),
+        ("temperament_config.temperament_history_maxlen", 3, 10),
+        ("temperament_config.temperament_pressure_threshold", 0.0, 1.0),
+        ("temperament_config.temperament_max_pressure", 0.0, 1.0),
+        ("temperament_config.temperament_min_pressure", 0.0, 1.0),
+        ("temperament_config.temperament_pressure_drop", 0.0, 1.0),
+    )
+    
     def __init__(self, config_manager: ConfigManager):
         """
         Initialize temperament configuration from ConfigManager.
@@ -32,27 +58,8 @@ class TemperamentConfig:
     def _validate_config(self) -> None:
         """Validate temperament configuration."""
         try:
-            # Define required keys and their validation ranges
-            required_keys = {
-                "temperament_config.mood_influence": (0.0, 1.0),
-                "temperament_config.history_maxlen": (3, 10),
-                "temperament_config.temp_eager_threshold": (0.7, 0.9),
-                "temperament_config.temp_sluggish_threshold": (0.3, 0.6),
-                "temperament_config.temp_mood_influence": (0.0, 1.0),
-                "temperament_config.temp_restless_drop": (0.0, 0.5),
-                "temperament_config.temp_melancholy_noise": (0.0, 0.1),
-                "temperament_config.conf_feedback_strength": (0.0, 1.0),
-                "temperament_config.temp_smoothing_factor": (0.0, 1.0),
-                "temperament_config.temperament_decay_rate": (0.0, 1.0),
-                "temperament_config.temperament_history_maxlen": (3, 10),
-                "temperament_config.temperament_pressure_threshold": (0.0, 1.0),
-                "temperament_config.temperament_max_pressure": (0.0, 1.0),
-                "temperament_config.temperament_min_pressure": (0.0, 1.0),
-                "temperament_config.temperament_pressure_drop": (0.0, 1.0),
-            }
-            
             # Validate each key
-            for key, (min_val, max_val) in required_keys.items():
+            for key, min_val, max_val in self._REQUIRED_KEYS:
                 if not self.config_manager.has_key(key):
                     raise ConfigurationError(f"Missing required config key: {key}")
                     
@@ -138,11 +145,9 @@ class TemperamentSystem:
         """
         def update_fn(state):
             if not hasattr(state, 'mood_score'):
-                if session_id is not None:
-                    random.seed(session_id)
-                else:
-                    random.seed()
-                state.mood_score = random.uniform(-0.2, 0.2)
+                # Private generator: same value for a given seed, without reseeding the global RNG
+                rng = random.Random(session_id)
+                state.mood_score = rng.uniform(-0.2, 0.2)
                 state.mood_label = self._get_mood_label(state.mood_score)
                 self.logger.record_event(
                     event_type="mood_initialized",
@@ -159,26 +164,36 @@ class TemperamentSystem:
         Example mapping: positive feedback = +1, negative feedback = -1, neutral = 0.
         """
         alpha = self.temperament_config.get("temperament_config.mood_smoothing", 0.8)
+        # Read thresholds once rather than on every (possibly retried) update_fn call
+        thresholds = self._mood_thresholds()
         def update_fn(state):
             prev = getattr(state, 'mood_score', 0.0)
             new = alpha * prev + (1 - alpha) * interaction_valence
             new = max(-1.0, min(1.0, new))
             state.mood_score = new
-            state.mood_label = self._get_mood_label(new)
-            self.logger.record_event(
-                event_type="mood_updated",
-                message=f"Mood updated to {state.mood_label} ({state.mood_score:.2f})",
-                additional_info={"interaction_valence": interaction_valence}
-            )
+            state.mood_label = self._get_mood_label(new, thresholds)
+            if self.logger.should_log("info"):
+                self.logger.record_event(
+                    event_type="mood_updated",
+                    message=f"Mood updated to {state.mood_label} ({state.mood_score:.2f})",
+                    additional_info={"interaction_valence": interaction_valence}
+                )
             return state
         self.state_manager.update_state_atomic(update_fn)
 
-    def _get_mood_label(self, mood_score: float) -> str:
+    def _mood_thresholds(self) -> Tuple[float, float]:
+        """Return the (cautious, curious) mood thresholds from config."""
+        return (
+            self.temperament_config.get("temperament_config.mood_cautious_threshold", _MOOD_CAUTIOUS_THRESHOLD),
+            self.temperament_config.get("temperament_config.mood_curious_threshold", _MOOD_CURIOUS_THRESHOLD),
+        )
+
+    def _get_mood_label(self, mood_score: float, thresholds: Optional[Tuple[float, float]] = None) -> str:
         """
         Derive a human-readable mood label from mood_score using configurable thresholds.
+        Callers labelling in a loop can pass pre-read thresholds to skip the config lookups.
         """
-        low = self.temperament_config.get("temperament_config.mood_cautious_threshold", -0.3)
-        high = self.temperament_config.get("temperament_config.mood_curious_threshold", 0.3)
+        low, high = thresholds if thresholds is not None else self._mood_thresholds()
         if mood_score < low:
             return "Cautious"
         elif mood_score > high:
@@ -221,37 +236,41 @@ class TemperamentSystem:
                 pressure_threshold_met = self.pressure.should_adjust(eager_threshold)
                 if pressure_threshold_met:
                     self.pressure.drop_pressure(pressure_drop)
+                    if self.logger.should_log("info"):
+                        self.logger.record_event(
+                            event_type="temperament_pressure_threshold_met",
+                            message="Temperament pressure met threshold, pressure dropped",
+                            level="info",
+                            additional_info={
+                                "adjusted_score": adjusted_score,
+                                "pressure_before_drop": self.pressure.current_pressure,
+                                "eager_threshold": eager_threshold,
+                                "pressure_drop_amount": pressure_drop,
+                                "new_pressure": self.pressure.current_pressure
+                            }
+                        )
+                if self.logger.should_log("info"):
                     self.logger.record_event(
-                        event_type="temperament_pressure_threshold_met",
-                        message="Temperament pressure met threshold, pressure dropped",
+                        event_type="temperament_state_updated",
+                        message="Temperament state updated",
                         level="info",
                         additional_info={
-                            "adjusted_score": adjusted_score,
-                            "pressure_before_drop": self.pressure.current_pressure,
-                            "eager_threshold": eager_threshold,
-                            "pressure_drop_amount": pressure_drop,
-                            "new_pressure": self.pressure.current_pressure
+                            "previous_score": previous_score,
+                            "new_score": state.current_temperament,
+                            "input_score": new_score,
+                            "current_pressure": self.pressure.current_pressure
                         }
                     )
-                self.logger.record_event(
-                    event_type="temperament_state_updated",
-                    message="Temperament state updated",
-                    level="info",
-                    additional_info={
-                        "previous_score": previous_score,
-                        "new_score": state.current_temperament,
-                        "input_score": new_score,
-                        "current_pressure": self.pressure.current_pressure
-                    }
-                )
             except Exception as e:
+                # Format the traceback once and share it between the log record and the error manager
+                stack_trace = traceback.format_exc()
                 self.logger.record_event(
                     event_type="temperament_update_error",
                     message=f"Failed to update temperament: {str(e)}",
                     level="error",
                     additional_info={
                         "error": str(e),
-                        "stack_trace": traceback.format_exc(),
+                        "stack_trace": stack_trace,
                         "current_score": getattr(state, 'current_temperament', None)
                     }
                 )
@@ -260,7 +279,7 @@ class TemperamentSystem:
                     error_type="temperament_update_error",
                     context={
                         "current_score": getattr(state, 'current_temperament', None),
-                        "stack_trace": traceback.format_exc()
+                        "stack_trace": stack_trace
                     }
                 )
                 raise
@@ -300,19 +319,20 @@ class TemperamentSystem:
                 adjusted_value = max(0.1, min(1.0, adjusted_value))
                 
                 # Log the adjustment
-                self.logger.record_event(
-                    event_type="parameter_adjusted",
-                    message="Parameter adjusted with temperament and pressure context",
-                    level="info",
-                    additional_info={
-                        "parameter_type": parameter_type,
-                        "base_value": base_value,
-                        "adjusted_value": adjusted_value,
-                        "temperament_score": current_score,
-                        "pressure_influence": pressure_influence,
-                        "adjustment": adjustment
-                    }
-                )
+                if self.logger.should_log("info"):
+                    self.logger.record_event(
+                        event_type="parameter_adjusted",
+                        message="Parameter adjusted with temperament and pressure context",
+                        level="info",
+                        additional_info={
+                            "parameter_type": parameter_type,
+                            "base_value": base_value,
+                            "adjusted_value": adjusted_value,
+                            "temperament_score": current_score,
+                            "pressure_influence": pressure_influence,
+                            "adjustment": adjustment
+                        }
+                    )
                 
                 return adjusted_value
                 
@@ -324,7 +344,7 @@ class TemperamentSystem:
             self.logger.log_error(
                 error_msg=f"Invalid input for parameter adjustment: {str(ve)}",
                 error_type="parameter_validation_error",
-                stack_trace=traceback.format_exc(),
+                exc_info=True,
                 additional_info={
                     "parameter_type": parameter_type,
                     "base_value": base_value
@@ -335,7 +355,7 @@ class TemperamentSystem:
              self.logger.log_error(
                 error_msg=str(nie),
                 error_type="parameter_adjustment_unsupported",
-                stack_trace=traceback.format_exc(),
+                exc_info=True,
                 additional_info={
                     "parameter_type": parameter_type,
                     "base_value": base_value
@@ -346,7 +366,7 @@ class TemperamentSystem:
             self.logger.log_error(
                 error_msg=f"Failed to adjust parameter: {str(e)}",
                 error_type="parameter_adjustment_error",
-                stack_trace=traceback.format_exc(),
+                exc_info=True,
                 additional_info={
                     "parameter_type": parameter_type,
                     "base_value": base_value
@@ -357,6 +377,22 @@ class TemperamentSystem:
 class TemperamentAdjuster:
     """Manages temperament adjustments and state updates."""
     
+    # Safe parameter ranges relevant to TemperamentAdjuster's scope, read from 'controls_config'.
+    # Built once: (short name, full config key, min, max, default = range midpoint)
+    _PARAM_SPEC = tuple(
+        (name, f"controls_config.{name}", min_val, max_val, (min_val + max_val) / 2.0)
+        for name, min_val, max_val in (
+            ("temp_smoothing_factor", 0.1, 1.0),
+            ("temp_eager_threshold", 0.5, 0.9),
+            ("temp_sluggish_threshold", 0.1, 0.5),
+            ("temp_mood_influence", 0.1, 0.9),
+            ("temp_restless_drop", 0.1, 0.5),
+            ("temp_melancholy_noise", 0.0, 0.2),
+            ("conf_feedback_strength", 0.1, 0.9),
+            ("temperament_decay_rate", 0.1, 0.9),
+        )
+    )
+    
     def __init__(
         self,
         config_handler: ConfigManager,
@@ -602,25 +638,9 @@ class TemperamentAdjuster:
         """
         config = self.config_handler.config_manager
         
-        # Define safe parameter ranges relevant to TemperamentAdjuster's scope
-        safe_ranges = {
-            "temp_smoothing_factor": (0.1, 1.0),
-            "temp_eager_threshold": (0.5, 0.9),
-            "temp_sluggish_threshold": (0.1, 0.5),
-            "temp_mood_influence": (0.1, 0.9),
-            "temp_restless_drop": (0.1, 0.5),
-            "temp_melancholy_noise": (0.0, 0.2),
-            "conf_feedback_strength": (0.1, 0.9),
-            "temperament_decay_rate": (0.1, 0.9)
-        }
-        
         # Get and validate parameters from 'controls_config' section
         params = {}
-        for key, (min_val, max_val) in safe_ranges.items():
-            # Construct the full key path expected by config_manager
-            config_key = f"controls_config.{key}"
-            # Provide a default value (e.g., midpoint) if key is missing
-            default_value = (min_val + max_val) / 2.0 
+        for key, config_key, min_val, max_val, default_value in self._PARAM_SPEC:
             value = config.get(config_key, default_value)
             
             # Validate type and range
@@ -664,7 +684,8 @@ class TemperamentPressure:
         self.frustration_rebound = self.config_manager.get("temperament_config.pressure_frustration_rebound", 0.4)
         self.joy_rebound = self.config_manager.get("temperament_config.pressure_joy_rebound", 0.6)
         self.reset_value = 0.5
-        self._last_eruption_time = 0.0
+        # Monotonic clock: cooldown is an elapsed interval, immune to wall-clock jumps
+        self._last_eruption_time = float("-inf")
         if self.state_manager:
             def init_fn(state):
                 if not hasattr(state, 'pressure'):
@@ -674,18 +695,22 @@ class TemperamentPressure:
 
     def update_pressure(self, interaction_valence: float) -> None:
         """Update pressure based on interaction valence and decay toward neutral."""
-        now = time.time()
+        # Bind tuning values to locals once; update_fn may be retried
+        reset_value = self.reset_value
+        push = -interaction_valence * self.sensitivity
+        decay = self.decay
         def update_fn(state):
-            pressure = getattr(state, 'pressure', self.reset_value)
-            pressure += -interaction_valence * self.sensitivity
-            pressure += (self.reset_value - pressure) * self.decay
+            pressure = getattr(state, 'pressure', reset_value)
+            pressure += push
+            pressure += (reset_value - pressure) * decay
             pressure = min(1.0, max(0.0, pressure))
             state.pressure = pressure
-            self.logger.record_event(
-                event_type="pressure_updated",
-                message=f"Pressure updated to {pressure:.2f}",
-                additional_info={"interaction_valence": interaction_valence}
-            )
+            if self.logger.should_log("info"):
+                self.logger.record_event(
+                    event_type="pressure_updated",
+                    message=f"Pressure updated to {pressure:.2f}",
+                    additional_info={"interaction_valence": interaction_valence}
+                )
             return state
         if self.state_manager:
             self.state_manager.update_state_atomic(update_fn)
@@ -697,16 +722,23 @@ class TemperamentPressure:
 
     def check_eruption(self) -> Optional[str]:
         """Check if an eruption should occur. Returns 'frustration', 'joy', or None. Handles cooldown and resets pressure as needed."""
-        now = time.time()
+        now = time.monotonic()
+        cooldown = self.cooldown
+        # Still cooling down: neither branch can fire, so skip the state clone entirely
+        if now - self._last_eruption_time <= cooldown:
+            return None
         kind = None
+        reset_value = self.reset_value
+        high_threshold = self.high_threshold
+        low_threshold = self.low_threshold
         def update_fn(state):
             nonlocal kind
-            pressure = getattr(state, 'pressure', self.reset_value)
-            if (pressure >= self.high_threshold and now - self._last_eruption_time > self.cooldown):
+            pressure = getattr(state, 'pressure', reset_value)
+            if (pressure >= high_threshold and now - self._last_eruption_time > cooldown):
                 kind = "frustration"
                 state.pressure = self.frustration_rebound
                 self._last_eruption_time = now
-            elif (pressure <= self.low_threshold and now - self._last_eruption_time > self.cooldown):
+            elif (pressure <= low_threshold and now - self._last_eruption_time > cooldown):
                 kind = "joy"
                 state.pressure = self.joy_rebound
                 self._last_eruption_time = now
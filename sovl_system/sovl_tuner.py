@@ -10,6 +10,8 @@ from sovl_trainer import SOVLTrainer
 from sovl_scaffold import CrossAttentionInjector
 from sovl_error import ErrorManager, ConfigurationError
 
+_UNSET = object()
+
 class ICuriosityManager(Protocol):
     """Interface for curiosity management."""
     def get_pressure(self) -> float: ...
@@ -288,10 +290,18 @@ class SOVLTuner:
         self, updates: Dict[str, Any], section: str, notify_component: Optional[callable] = None
     ) -> bool:
         """Helper method to update configuration batch and notify components."""
-        if not updates:
-            return True
-
         try:
+            # Drop keys whose value already matches the cached section so re-published,
+            # unchanged settings don't cost a config write, a save, and a notification.
+            cached = self._config_sections.get(section)
+            if isinstance(cached, dict):
+                updates = {
+                    key: value for key, value in updates.items()
+                    if cached.get(key.split(".")[-1], _UNSET) != value
+                }
+            if not updates:
+                return True
+
             success = self.config_manager.update_batch(updates, rollback_on_failure=True)
             if success:
                 for key, value in updates.items():
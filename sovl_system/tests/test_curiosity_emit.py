@@ -0,0 +1,114 @@
+"""Tests for the curiosity background emission queue: dispatch order, batching, timestamps, and exit flush."""
+import importlib.util
+import os
+import queue
+import sys
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# sovl_curiosity pulls in the model stack at import time
+REQUIRED_MODULES = ("torch", "numpy", "transformers", "peft", "bitsandbytes", "faiss")
+HAS_DEPS = all(importlib.util.find_spec(name) is not None for name in REQUIRED_MODULES)
+
+if HAS_DEPS:
+    import sovl_curiosity
+    from sovl_logger import Logger
+
+    class RecordingLogger(Logger):
+        """Logger that records calls into a shared sink list instead of writing files."""
+
+        def __init__(self, name: str, sink: list):
+            self.name = name
+            self.sink = sink
+
+        def record_event(self, **kwargs):
+            self.sink.append(("event", self.name, kwargs["event_type"]))
+
+        def record_events(self, events):
+            self.sink.append(("batch", self.name, [event["event_type"] for event in events]))
+            self.batches = getattr(self, "batches", []) + [events]
+
+        def log_error(self, **kwargs):
+            self.sink.append(("error", self.name, kwargs["error_msg"]))
+
+
+@unittest.skipUnless(HAS_DEPS, f"sovl_curiosity needs {', '.join(REQUIRED_MODULES)}")
+class TestCuriosityEmitQueue(unittest.TestCase):
+    def setUp(self):
+        self.sink = []
+        self.logger = RecordingLogger("main", self.sink)
+        scribe_patch = mock.patch.object(
+            sovl_curiosity, "capture_scribe_event",
+            side_effect=lambda **kwargs: self.sink.append(("scribe", kwargs["event_type"]))
+        )
+        scribe_patch.start()
+        self.addCleanup(scribe_patch.stop)
+        # A private queue and a placeholder thread keep the daemon writer out of these tests
+        for name, value in (("_emit_queue", queue.Queue()), ("_emit_thread", object())):
+            patcher = mock.patch.object(sovl_curiosity, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def _event(self, event_type, logger=None, scribe=None, unix_time=None):
+        sovl_curiosity._emit_async(
+            sovl_curiosity._EMIT_EVENT,
+            logger or self.logger,
+            {"event_type": event_type, "message": event_type},
+            scribe,
+            unix_time
+        )
+
+    def test_runs_are_flushed_before_other_records(self):
+        other = RecordingLogger("other", self.sink)
+        self._event("a", scribe={"event_type": "scribe_a"})
+        self._event("b")
+        sovl_curiosity._emit_async(sovl_curiosity._EMIT_ERROR, self.logger, {"error_msg": "boom"})
+        self._event("c")
+        self._event("d", logger=other)
+        sovl_curiosity._emit_async(sovl_curiosity._EMIT_SCRIBE, scribe={"event_type": "scribe_only"})
+        sovl_curiosity._flush_emit_queue()
+        self.assertEqual(self.sink, [
+            ("batch", "main", ["a", "b"]),
+            ("scribe", "scribe_a"),
+            ("error", "main", "boom"),
+            ("batch", "main", ["c"]),
+            ("batch", "other", ["d"]),
+            ("scribe", "scribe_only"),
+        ])
+
+    def test_batched_events_carry_enqueue_timestamp(self):
+        self._event("a", unix_time=1000.0)
+        self._event("b", unix_time=1001.5)
+        sovl_curiosity._flush_emit_queue()
+        timestamps = [event["timestamp"] for event in self.logger.batches[0]]
+        self.assertEqual(timestamps, [1000.0, 1001.5])
+
+    def test_exit_flush_drains_queue(self):
+        for event_type in ("a", "b", "c"):
+            self._event(event_type)
+        self.assertEqual(self.sink, [])
+        sovl_curiosity._flush_emit_queue()
+        self.assertEqual(self.sink, [("batch", "main", ["a", "b", "c"])])
+        self.assertTrue(sovl_curiosity._emit_queue.empty())
+        sovl_curiosity._flush_emit_queue()
+        self.assertEqual(len(self.sink), 1)
+
+    def test_full_queue_emits_inline(self):
+        with mock.patch.object(sovl_curiosity, "_emit_queue", queue.Queue(maxsize=1)):
+            self._event("queued")
+            self._event("inline")
+            self.assertEqual(self.sink, [("event", "main", "inline")])
+
+    def test_failing_sink_does_not_stop_the_batch(self):
+        self.logger.record_events = mock.Mock(side_effect=RuntimeError("disk full"))
+        self._event("a")
+        sovl_curiosity._emit_async(sovl_curiosity._EMIT_SCRIBE, scribe={"event_type": "after"})
+        with self.assertLogs(sovl_curiosity._emit_fallback_logger, level="ERROR"):
+            sovl_curiosity._flush_emit_queue()
+        self.assertEqual(self.sink, [("scribe", "after")])
+
+
+if __name__ == "__main__":
+    unittest.main()
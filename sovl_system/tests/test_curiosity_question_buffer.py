@@ -0,0 +1,81 @@
+"""Tests for the heap-backed internal curiosity question buffer."""
+import importlib.util
+import os
+import sys
+import unittest
+from collections import deque
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# sovl_curiosity pulls in the model stack at import time
+REQUIRED_MODULES = ("torch", "numpy", "transformers", "peft", "bitsandbytes", "faiss")
+HAS_DEPS = all(importlib.util.find_spec(name) is not None for name in REQUIRED_MODULES)
+
+if HAS_DEPS:
+    from sovl_curiosity import CuriosityManager
+
+
+@unittest.skipUnless(HAS_DEPS, f"sovl_curiosity needs {', '.join(REQUIRED_MODULES)}")
+class TestInternalQuestionBuffer(unittest.TestCase):
+    def _manager(self, maxlen: int = 20) -> "CuriosityManager":
+        # Only the buffer fields are needed; skip the config/state wiring of __init__
+        manager = CuriosityManager.__new__(CuriosityManager)
+        manager._internal_questions = deque(maxlen=maxlen)
+        manager._question_heap = []
+        manager._live_question_seqs = set()
+        manager._question_seq = 0
+        return manager
+
+    def test_best_is_highest_score_and_earliest_on_ties(self):
+        manager = self._manager()
+        manager._push_internal_question("low", 0.2, 1.0)
+        manager._push_internal_question("high", 0.9, 2.0)
+        manager._push_internal_question("high_later", 0.9, 3.0)
+        self.assertEqual(manager._best_internal_question(), ("high", 0.9, 2.0))
+
+    def test_expired_questions_are_not_picked(self):
+        manager = self._manager()
+        manager._push_internal_question("old_best", 0.9, 1.0)
+        manager._push_internal_question("fresh", 0.5, 10.0)
+        manager._expire_internal_questions(cutoff=5.0)
+        self.assertEqual(manager._best_internal_question(), ("fresh", 0.5, 10.0))
+        self.assertEqual([entry[0] for entry in manager._internal_questions], ["fresh"])
+
+    def test_evicted_questions_are_not_picked(self):
+        manager = self._manager(maxlen=2)
+        manager._push_internal_question("evicted_best", 0.9, 1.0)
+        manager._push_internal_question("b", 0.3, 2.0)
+        manager._push_internal_question("c", 0.6, 3.0)
+        self.assertEqual(manager._best_internal_question(), ("c", 0.6, 3.0))
+
+    def test_pop_best_leaves_runners_up(self):
+        manager = self._manager()
+        manager._push_internal_question("a", 0.4, 1.0)
+        manager._push_internal_question("b", 0.8, 2.0)
+        manager._push_internal_question("c", 0.6, 3.0)
+        self.assertEqual(manager._pop_best_internal_question(), ("b", 0.8, 2.0))
+        self.assertEqual([entry[0] for entry in manager._internal_questions], ["a", "c"])
+        self.assertEqual(manager._pop_best_internal_question(), ("c", 0.6, 3.0))
+        self.assertEqual(manager._pop_best_internal_question(), ("a", 0.4, 1.0))
+        self.assertIsNone(manager._pop_best_internal_question())
+
+    def test_clear_empties_buffer(self):
+        manager = self._manager()
+        manager._push_internal_question("a", 0.4, 1.0)
+        manager._push_internal_question("b", 0.8, 2.0)
+        manager._clear_internal_questions()
+        self.assertIsNone(manager._best_internal_question())
+        self.assertEqual(len(manager._internal_questions), 0)
+        manager._push_internal_question("c", 0.1, 3.0)
+        self.assertEqual(manager._best_internal_question(), ("c", 0.1, 3.0))
+
+    def test_heap_is_compacted(self):
+        manager = self._manager(maxlen=3)
+        for i in range(50):
+            manager._push_internal_question(f"q{i}", i / 50, float(i))
+        self.assertLessEqual(len(manager._question_heap), 2 * 3)
+        self.assertEqual(manager._best_internal_question(), ("q49", 49 / 50, 49.0))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,59 @@
+"""Tests for SOVLTuner._update_config_batch skipping unchanged values."""
+import importlib.util
+import os
+import sys
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# sovl_tuner pulls in the model stack at import time
+REQUIRED_MODULES = ("torch", "numpy", "transformers", "peft", "bitsandbytes", "faiss")
+HAS_DEPS = all(importlib.util.find_spec(name) is not None for name in REQUIRED_MODULES)
+
+if HAS_DEPS:
+    from sovl_tuner import SOVLTuner
+
+
+@unittest.skipUnless(HAS_DEPS, f"sovl_tuner needs {', '.join(REQUIRED_MODULES)}")
+class TestUpdateConfigBatch(unittest.TestCase):
+    def setUp(self):
+        # Only the collaborators _update_config_batch touches; skip the wiring of __init__
+        self.tuner = SOVLTuner.__new__(SOVLTuner)
+        self.tuner.config_manager = mock.Mock()
+        self.tuner.config_manager.update_batch.return_value = True
+        self.tuner.logger = mock.Mock()
+        self.tuner.error_manager = mock.Mock()
+        self.tuner._config_sections = {"curiosity_config": {"weight_novelty": 0.5, "queue_maxlen": 10}}
+        self.notify = mock.Mock()
+
+    def test_unchanged_values_are_skipped(self):
+        updates = {"curiosity_config.weight_novelty": 0.5, "curiosity_config.queue_maxlen": 10}
+        self.assertTrue(self.tuner._update_config_batch(updates, "curiosity_config", self.notify))
+        self.tuner.config_manager.update_batch.assert_not_called()
+        self.tuner.config_manager.save_config.assert_not_called()
+        self.notify.assert_not_called()
+
+    def test_only_changed_values_are_written(self):
+        updates = {"curiosity_config.weight_novelty": 0.7, "curiosity_config.queue_maxlen": 10}
+        self.assertTrue(self.tuner._update_config_batch(updates, "curiosity_config", self.notify))
+        expected = {"curiosity_config.weight_novelty": 0.7}
+        self.tuner.config_manager.update_batch.assert_called_once_with(expected, rollback_on_failure=True)
+        self.tuner.config_manager.save_config.assert_called_once()
+        self.notify.assert_called_once_with(expected)
+        self.assertEqual(self.tuner._config_sections["curiosity_config"]["weight_novelty"], 0.7)
+
+    def test_new_keys_are_written(self):
+        updates = {"curiosity_config.decay_rate": 0.9}
+        self.assertTrue(self.tuner._update_config_batch(updates, "curiosity_config"))
+        self.tuner.config_manager.update_batch.assert_called_once_with(updates, rollback_on_failure=True)
+
+    def test_non_dict_section_is_reported_not_raised(self):
+        self.tuner._config_sections["curiosity_config"] = None
+        updates = {"curiosity_config.weight_novelty": 0.7}
+        self.assertFalse(self.tuner._update_config_batch(updates, "curiosity_config"))
+        self.tuner.error_manager.handle_error.assert_called_once()
+
+
+if __name__ == "__main__":
+    unittest.main()